@@ -1,27 +1,21 @@
 
 import { Toaster } from "@/components/ui/sonner";
-import { TooltipProvider } from "@/components/ui/tooltip";
-import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
 import { BrowserRouter, Routes, Route } from "react-router-dom";
 import { navItems } from "./nav-items";
 import CLIAssistant from "./components/CLIAssistant";
 
-const queryClient = new QueryClient();
-
 const App = () => (
-  <QueryClientProvider client={queryClient}>
-    <TooltipProvider>
-      <Toaster />
-      <BrowserRouter>
-        <Routes>
-          <Route path="/" element={<CLIAssistant />} />
-          {navItems.map(({ to, page }) => (
-            <Route key={to} path={to} element={page} />
-          ))}
-        </Routes>
-      </BrowserRouter>
-    </TooltipProvider>
-  </QueryClientProvider>
+  <>
+    <Toaster />
+    <BrowserRouter>
+      <Routes>
+        <Route path="/" element={<CLIAssistant />} />
+        {navItems.map(({ to, page }) => (
+          <Route key={to} path={to} element={page} />
+        ))}
+      </Routes>
+    </BrowserRouter>
+  </>
 );
 
 export default App;
@@ -1,17 +1,15 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback, useRef, lazy, Suspense } from 'react';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from './ui/card';
 import { Button } from './ui/button';
 import { Input } from './ui/input';
 import { Textarea } from './ui/textarea';
 import { Badge } from './ui/badge';
 import { Alert, AlertDescription } from './ui/alert';
-import { Tabs, TabsContent, TabsList, TabsTrigger } from './ui/tabs';
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, DialogTrigger } from './ui/dialog';
 import { useToast } from '../hooks/use-toast';
 import { 
   Terminal, 
   Play, 
-  Download, 
   History, 
   AlertTriangle, 
   CheckCircle, 
@@ -19,7 +17,6 @@ import {
   BarChart3,
   Settings,
   Upload,
-  Trash2,
   Copy
 } from 'lucide-react';
 
@@ -43,152 +40,368 @@ interface Statistics {
   };
 }
 
+const HISTORY_STORAGE_KEY = 'cli-assistant-history';
+
+// Upper bound on history kept when a new command is added; keeps per-execute copies
+// from growing without limit. Already-persisted history is loaded as-is.
+const MAX_HISTORY = 1000;
+
+// How long history changes are batched before being written to localStorage
+const HISTORY_SAVE_DELAY_MS = 500;
+
+const commandPatterns = [
+  // File operations
+  { pattern: /list.*files?|show.*directory|ls/, command: 'ls -la', risk: 'low' as const },
+  { pattern: /create.*file|touch.*file/, command: 'touch filename.txt', risk: 'low' as const },
+  { pattern: /copy.*file|cp/, command: 'cp source.txt destination.txt', risk: 'medium' as const },
+  { pattern: /move.*file|mv/, command: 'mv oldname.txt newname.txt', risk: 'medium' as const },
+  { pattern: /delete.*file|remove.*file|rm/, command: 'rm filename.txt', risk: 'high' as const },
+  { pattern: /find.*file/, command: 'find . -name "*.txt"', risk: 'low' as const },
+  
+  // Directory operations
+  { pattern: /create.*directory|mkdir/, command: 'mkdir new_directory', risk: 'low' as const },
+  { pattern: /change.*directory|cd/, command: 'cd /path/to/directory', risk: 'low' as const },
+  { pattern: /current.*directory|pwd/, command: 'pwd', risk: 'low' as const },
+  
+  // System information
+  { pattern: /system.*info|uname/, command: 'uname -a', risk: 'low' as const },
+  { pattern: /disk.*usage|df/, command: 'df -h', risk: 'low' as const },
+  { pattern: /memory.*usage|free/, command: 'free -h', risk: 'low' as const },
+  { pattern: /process.*list|ps/, command: 'ps aux', risk: 'low' as const },
+  { pattern: /top.*processes|htop/, command: 'htop', risk: 'low' as const },
+  
+  // Network operations
+  { pattern: /ping/, command: 'ping google.com', risk: 'low' as const },
+  { pattern: /network.*status|netstat/, command: 'netstat -tuln', risk: 'low' as const },
+  { pattern: /download.*file|wget|curl/, command: 'wget https://example.com/file.txt', risk: 'medium' as const },
+  
+  // Git operations
+  { pattern: /git.*status/, command: 'git status', risk: 'low' as const },
+  { pattern: /git.*add/, command: 'git add .', risk: 'medium' as const },
+  { pattern: /git.*commit/, command: 'git commit -m "commit message"', risk: 'medium' as const },
+  { pattern: /git.*push/, command: 'git push origin main', risk: 'medium' as const },
+  { pattern: /git.*pull/, command: 'git pull origin main', risk: 'medium' as const },
+  
+  // Docker operations
+  { pattern: /docker.*list|docker.*ps/, command: 'docker ps -a', risk: 'low' as const },
+  { pattern: /docker.*run/, command: 'docker run -it ubuntu:latest /bin/bash', risk: 'medium' as const },
+  { pattern: /docker.*stop/, command: 'docker stop container_name', risk: 'medium' as const },
+  
+  // Package management
+  { pattern: /install.*package|apt.*install/, command: 'sudo apt install package_name', risk: 'high' as const },
+  { pattern: /update.*system|apt.*update/, command: 'sudo apt update && sudo apt upgrade', risk: 'high' as const },
+  
+  // File permissions
+  { pattern: /change.*permission|chmod/, command: 'chmod 755 filename', risk: 'medium' as const },
+  { pattern: /change.*owner|chown/, command: 'sudo chown user:group filename', risk: 'high' as const },
+  
+  // Archive operations
+  { pattern: /compress|tar.*create/, command: 'tar -czf archive.tar.gz directory/', risk: 'low' as const },
+  { pattern: /extract|tar.*extract/, command: 'tar -xzf archive.tar.gz', risk: 'medium' as const },
+  
+  // Text processing
+  { pattern: /search.*text|grep/, command: 'grep "search_term" filename.txt', risk: 'low' as const },
+  { pattern: /count.*lines|wc/, command: 'wc -l filename.txt', risk: 'low' as const },
+  { pattern: /sort.*file/, command: 'sort filename.txt', risk: 'low' as const },
+];
+
+const matchCommandPattern = (lowerPrompt: string) =>
+  commandPatterns.find(({ pattern }) => pattern.test(lowerPrompt));
+
+// Matching is pure in the prompt, so repeated prompts are served from a small LRU
+// (Map iteration order is insertion order; re-inserting a hit marks it most recent).
+const PATTERN_CACHE_SIZE = 1024;
+const patternCache = new Map<string, (typeof commandPatterns)[number] | undefined>();
+
+const findCommandPattern = (lowerPrompt: string) => {
+  if (patternCache.has(lowerPrompt)) {
+    const cached = patternCache.get(lowerPrompt);
+    patternCache.delete(lowerPrompt);
+    patternCache.set(lowerPrompt, cached);
+    return cached;
+  }
+
+  const match = matchCommandPattern(lowerPrompt);
+  patternCache.set(lowerPrompt, match);
+  if (patternCache.size > PATTERN_CACHE_SIZE) {
+    patternCache.delete(patternCache.keys().next().value as string);
+  }
+  return match;
+};
+
+// Risk presentation lookups, built once instead of switching on every render
+const riskColors: Record<Command['riskLevel'], string> = {
+  low: 'bg-green-100 text-green-800',
+  medium: 'bg-yellow-100 text-yellow-800',
+  high: 'bg-red-100 text-red-800'
+};
+
+const riskIcons: Record<Command['riskLevel'], JSX.Element> = {
+  low: <CheckCircle className="w-4 h-4" />,
+  medium: <AlertTriangle className="w-4 h-4" />,
+  high: <XCircle className="w-4 h-4" />
+};
+
+const getRiskColor = (risk: string) =>
+  Object.prototype.hasOwnProperty.call(riskColors, risk) ? riskColors[risk as Command['riskLevel']] : 'bg-gray-100 text-gray-800';
+
+const getRiskIcon = (risk: string) =>
+  Object.prototype.hasOwnProperty.call(riskIcons, risk) ? riskIcons[risk as Command['riskLevel']] : <AlertTriangle className="w-4 h-4" />;
+
+// Static row definitions for the risk distribution table in the statistics dialog
+const riskDistributionRows: { risk: keyof Statistics['riskDistribution']; label: string; className: string }[] = [
+  { risk: 'low', label: 'Low Risk', className: riskColors.low },
+  { risk: 'medium', label: 'Medium Risk', className: riskColors.medium },
+  { risk: 'high', label: 'High Risk', className: riskColors.high },
+];
+
+// Records a User Timing measure for each phase, visible in the browser's Performance panel.
+// Dev builds only: measures are never cleared, so production would accumulate them per tab.
+const measurePhase = (phase: string, start: number) => {
+  if (!import.meta.env.DEV) return;
+  performance.measure(`cli-assistant:${phase}`, { start, end: performance.now() });
+};
+
+const timePhase = <T,>(phase: string, run: () => T): T => {
+  if (!import.meta.env.DEV) return run();
+  const start = performance.now();
+  try {
+    return run();
+  } finally {
+    measurePhase(phase, start);
+  }
+};
+
+// Prompts are embedded as `#` comments in exported scripts; a line break would let the
+// rest of the prompt escape the comment and run as a shell command
+const toScriptComment = (text: string) => text.replace(/[\r\n]+/g, ' ');
+
+// Read persisted history once, synchronously, as the initial state value
+const loadHistory = (): Command[] => {
+  const savedHistory = localStorage.getItem(HISTORY_STORAGE_KEY);
+  if (!savedHistory) return [];
+  try {
+    const parsedHistory = JSON.parse(savedHistory);
+    if (!Array.isArray(parsedHistory)) return [];
+    // Revive timestamps in place; a missing one becomes an Invalid Date rather than undefined
+    for (const cmd of parsedHistory) cmd.timestamp = new Date(cmd.timestamp);
+    return parsedHistory;
+  } catch (error) {
+    console.error('Failed to load history:', error);
+    return [];
+  }
+};
+
+const examplePrompts = [
+  'list all files',
+  'check disk usage',
+  'find Python files',
+  'show running processes'
+];
+
+const computeStatistics = (commands: Command[]): Statistics => {
+  const stats: Statistics = {
+    totalCommands: commands.length,
+    executedCommands: 0,
+    riskDistribution: { low: 0, medium: 0, high: 0 }
+  };
+  // Single pass over the history instead of one filter per counter
+  for (const cmd of commands) {
+    if (cmd.executed) stats.executedCommands++;
+    if (Object.prototype.hasOwnProperty.call(stats.riskDistribution, cmd.riskLevel)) {
+      stats.riskDistribution[cmd.riskLevel]++;
+    }
+  }
+  return stats;
+};
+
+// Explanation text per risk level; only the user's action is spliced in per call
+const explanationTemplates: Record<Command['riskLevel'], (action: string) => string> = {
+  low: action => `This is a safe read-only command that will ${action}. It won't modify your system.`,
+  medium: action => `This command will ${action}. It may modify files or system state, so review it carefully before executing.`,
+  high: action => `⚠️ This is a potentially dangerous command that will ${action}. It can make significant system changes. Use with extreme caution!`
+};
+
+const generateCommand = (userPrompt: string): Command => {
+  const lowerPrompt = userPrompt.toLowerCase();
+  
+  // Find matching pattern
+  const match = findCommandPattern(lowerPrompt);
+  
+  let command = 'echo "Command not recognized"';
+  let riskLevel: 'low' | 'medium' | 'high' = 'low';
+  let explanation = 'This command was not recognized by the pattern matcher.';
+  
+  if (match) {
+    command = match.command;
+    riskLevel = match.risk;
+    explanation = explanationTemplates[riskLevel](lowerPrompt);
+  }
+  
+  const timestamp = new Date();
+  return {
+    id: timestamp.getTime().toString(),
+    prompt: userPrompt,
+    command,
+    explanation,
+    riskLevel,
+    timestamp,
+    executed: false
+  };
+};
+
+// Same output as Date#toLocaleString(), but the locale data is resolved once
+// instead of building a new formatter for every row on every render
+const timestampFormat = new Intl.DateTimeFormat(undefined, {
+  year: 'numeric',
+  month: 'numeric',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric'
+});
+
+// Intl's format() throws on an Invalid Date where toLocaleString() returns "Invalid Date",
+// so one unparseable stored timestamp must not take down the whole list
+const formatTimestamp = (timestamp: Date) =>
+  Number.isNaN(timestamp.getTime()) ? 'Invalid Date' : timestampFormat.format(timestamp);
+
+interface HistoryListProps {
+  history: Command[];
+  onCopy: (command: string) => void;
+}
+
+// Memoized so keystrokes in the prompt input don't re-render every history row
+const HistoryList = React.memo(({ history, onCopy }: HistoryListProps) => (
+  <Card>
+    <CardHeader>
+      <CardTitle className="flex items-center gap-2">
+        <History className="w-5 h-5" />
+        Command History ({history.length})
+      </CardTitle>
+    </CardHeader>
+    <CardContent>
+      <div className="space-y-3 max-h-96 overflow-y-auto">
+        {history.map((cmd) => (
+          <div key={cmd.id} className="border rounded-lg p-3 space-y-2">
+            <div className="flex items-center justify-between">
+              <span className="text-sm text-gray-600">{cmd.prompt}</span>
+              <div className="flex items-center gap-2">
+                <Badge className={getRiskColor(cmd.riskLevel)}>
+                  {cmd.riskLevel}
+                </Badge>
+                {cmd.executed && (
+                  <Badge className="bg-blue-100 text-blue-800">
+                    executed
+                  </Badge>
+                )}
+              </div>
+            </div>
+            <div className="flex items-center justify-between">
+              <code className="text-sm bg-gray-100 px-2 py-1 rounded flex-1 mr-2">
+                {cmd.command}
+              </code>
+              <Button
+                variant="outline"
+                size="sm"
+                onClick={() => onCopy(cmd.command)}
+              >
+                <Copy className="w-3 h-3" />
+              </Button>
+            </div>
+            <div className="text-xs text-gray-500">
+              {formatTimestamp(cmd.timestamp)}
+            </div>
+          </div>
+        ))}
+      </div>
+    </CardContent>
+  </Card>
+));
+
+// Dynamic imports are cached, so calling this again after the first load is free
+const loadSettingsTabs = () => import('./SettingsTabs');
+
+// Fire-and-forget warm-up on hover/focus; a failed load is reported by the boundary on open
+const prefetchSettingsTabs = () => {
+  loadSettingsTabs().catch(() => {});
+};
+
+const SettingsTabs = lazy(loadSettingsTabs);
+
+// Keeps a failed settings chunk load (offline, or stale assets after a redeploy)
+// inside the dialog instead of unmounting the whole app. Re-importing the same chunk
+// URL cannot recover from either, so the button reloads to pick up the current assets;
+// pending history is flushed on pagehide.
+class SettingsTabsBoundary extends React.Component<{ children: React.ReactNode }, { failed: boolean }> {
+  state = { failed: false };
+
+  static getDerivedStateFromError() {
+    return { failed: true };
+  }
+
+  render() {
+    if (!this.state.failed) return this.props.children;
+
+    return (
+      <Alert variant="destructive">
+        <AlertTriangle className="h-4 w-4" />
+        <AlertDescription className="flex items-center justify-between gap-2">
+          Couldn't load settings.
+          <Button variant="outline" size="sm" onClick={() => window.location.reload()}>
+            Reload
+          </Button>
+        </AlertDescription>
+      </Alert>
+    );
+  }
+}
+
 const CLIAssistant: React.FC = () => {
   const [prompt, setPrompt] = useState('');
   const [currentCommand, setCurrentCommand] = useState<Command | null>(null);
-  const [history, setHistory] = useState<Command[]>([]);
+  const [history, setHistory] = useState<Command[]>(() => timePhase('load-history', loadHistory));
   const [isGenerating, setIsGenerating] = useState(false);
-  const [statistics, setStatistics] = useState<Statistics>({
-    totalCommands: 0,
-    executedCommands: 0,
-    riskDistribution: { low: 0, medium: 0, high: 0 }
-  });
+  // Derived from history during render, so it never lags behind or needs its own state update
+  const statistics = useMemo(() => computeStatistics(history), [history]);
   const { toast } = useToast();
 
-  // Load data from localStorage on component mount
-  useEffect(() => {
-    const savedHistory = localStorage.getItem('cli-assistant-history');
-    if (savedHistory) {
-      try {
-        const parsedHistory = JSON.parse(savedHistory).map((cmd: any) => ({
-          ...cmd,
-          timestamp: new Date(cmd.timestamp)
-        }));
-        setHistory(parsedHistory);
-        updateStatistics(parsedHistory);
-      } catch (error) {
-        console.error('Failed to load history:', error);
-      }
+  // Latest history not yet written to localStorage
+  const unsavedHistory = useRef<Command[] | null>(null);
+
+  const flushHistory = useCallback(() => {
+    if (unsavedHistory.current) {
+      const commands = unsavedHistory.current;
+      // Timestamps are stored as epoch milliseconds; loadHistory's new Date() also accepts older ISO strings
+      timePhase('save-history', () => localStorage.setItem(
+        HISTORY_STORAGE_KEY,
+        JSON.stringify(commands.map(c => ({ ...c, timestamp: c.timestamp.getTime() })))
+      ));
+      unsavedHistory.current = null;
     }
   }, []);
 
-  // Save to localStorage whenever history changes
+  // Save to localStorage whenever history changes, coalescing bursts of changes into one write
   useEffect(() => {
-    if (history.length > 0) {
-      localStorage.setItem('cli-assistant-history', JSON.stringify(history));
-      updateStatistics(history);
-    }
-  }, [history]);
-
-  const updateStatistics = (commands: Command[]) => {
-    const stats: Statistics = {
-      totalCommands: commands.length,
-      executedCommands: commands.filter(cmd => cmd.executed).length,
-      riskDistribution: {
-        low: commands.filter(cmd => cmd.riskLevel === 'low').length,
-        medium: commands.filter(cmd => cmd.riskLevel === 'medium').length,
-        high: commands.filter(cmd => cmd.riskLevel === 'high').length
-      }
-    };
-    setStatistics(stats);
-  };
+    if (history.length === 0) return;
+    unsavedHistory.current = history;
+    const timer = setTimeout(flushHistory, HISTORY_SAVE_DELAY_MS);
+    return () => clearTimeout(timer);
+  }, [history, flushHistory]);
 
-  const commandPatterns = [
-    // File operations
-    { pattern: /list.*files?|show.*directory|ls/, command: 'ls -la', risk: 'low' as const },
-    { pattern: /create.*file|touch.*file/, command: 'touch filename.txt', risk: 'low' as const },
-    { pattern: /copy.*file|cp/, command: 'cp source.txt destination.txt', risk: 'medium' as const },
-    { pattern: /move.*file|mv/, command: 'mv oldname.txt newname.txt', risk: 'medium' as const },
-    { pattern: /delete.*file|remove.*file|rm/, command: 'rm filename.txt', risk: 'high' as const },
-    { pattern: /find.*file/, command: 'find . -name "*.txt"', risk: 'low' as const },
-    
-    // Directory operations
-    { pattern: /create.*directory|mkdir/, command: 'mkdir new_directory', risk: 'low' as const },
-    { pattern: /change.*directory|cd/, command: 'cd /path/to/directory', risk: 'low' as const },
-    { pattern: /current.*directory|pwd/, command: 'pwd', risk: 'low' as const },
-    
-    // System information
-    { pattern: /system.*info|uname/, command: 'uname -a', risk: 'low' as const },
-    { pattern: /disk.*usage|df/, command: 'df -h', risk: 'low' as const },
-    { pattern: /memory.*usage|free/, command: 'free -h', risk: 'low' as const },
-    { pattern: /process.*list|ps/, command: 'ps aux', risk: 'low' as const },
-    { pattern: /top.*processes|htop/, command: 'htop', risk: 'low' as const },
-    
-    // Network operations
-    { pattern: /ping/, command: 'ping google.com', risk: 'low' as const },
-    { pattern: /network.*status|netstat/, command: 'netstat -tuln', risk: 'low' as const },
-    { pattern: /download.*file|wget|curl/, command: 'wget https://example.com/file.txt', risk: 'medium' as const },
-    
-    // Git operations
-    { pattern: /git.*status/, command: 'git status', risk: 'low' as const },
-    { pattern: /git.*add/, command: 'git add .', risk: 'medium' as const },
-    { pattern: /git.*commit/, command: 'git commit -m "commit message"', risk: 'medium' as const },
-    { pattern: /git.*push/, command: 'git push origin main', risk: 'medium' as const },
-    { pattern: /git.*pull/, command: 'git pull origin main', risk: 'medium' as const },
-    
-    // Docker operations
-    { pattern: /docker.*list|docker.*ps/, command: 'docker ps -a', risk: 'low' as const },
-    { pattern: /docker.*run/, command: 'docker run -it ubuntu:latest /bin/bash', risk: 'medium' as const },
-    { pattern: /docker.*stop/, command: 'docker stop container_name', risk: 'medium' as const },
-    
-    // Package management
-    { pattern: /install.*package|apt.*install/, command: 'sudo apt install package_name', risk: 'high' as const },
-    { pattern: /update.*system|apt.*update/, command: 'sudo apt update && sudo apt upgrade', risk: 'high' as const },
-    
-    // File permissions
-    { pattern: /change.*permission|chmod/, command: 'chmod 755 filename', risk: 'medium' as const },
-    { pattern: /change.*owner|chown/, command: 'sudo chown user:group filename', risk: 'high' as const },
-    
-    // Archive operations
-    { pattern: /compress|tar.*create/, command: 'tar -czf archive.tar.gz directory/', risk: 'low' as const },
-    { pattern: /extract|tar.*extract/, command: 'tar -xzf archive.tar.gz', risk: 'medium' as const },
-    
-    // Text processing
-    { pattern: /search.*text|grep/, command: 'grep "search_term" filename.txt', risk: 'low' as const },
-    { pattern: /count.*lines|wc/, command: 'wc -l filename.txt', risk: 'low' as const },
-    { pattern: /sort.*file/, command: 'sort filename.txt', risk: 'low' as const },
-  ];
-
-  const generateCommand = async (userPrompt: string): Promise<Command> => {
-    const lowerPrompt = userPrompt.toLowerCase();
-    
-    // Find matching pattern
-    const match = commandPatterns.find(pattern => pattern.pattern.test(lowerPrompt));
-    
-    let command = 'echo "Command not recognized"';
-    let riskLevel: 'low' | 'medium' | 'high' = 'low';
-    let explanation = 'This command was not recognized by the pattern matcher.';
-    
-    if (match) {
-      command = match.command;
-      riskLevel = match.risk;
-      
-      // Generate explanation based on risk level
-      switch (riskLevel) {
-        case 'low':
-          explanation = `This is a safe read-only command that will ${userPrompt.toLowerCase()}. It won't modify your system.`;
-          break;
-        case 'medium':
-          explanation = `This command will ${userPrompt.toLowerCase()}. It may modify files or system state, so review it carefully before executing.`;
-          break;
-        case 'high':
-          explanation = `⚠️ This is a potentially dangerous command that will ${userPrompt.toLowerCase()}. It can make significant system changes. Use with extreme caution!`;
-          break;
-      }
-    }
-    
-    return {
-      id: Date.now().toString(),
-      prompt: userPrompt,
-      command,
-      explanation,
-      riskLevel,
-      timestamp: new Date(),
-      executed: false
+  // Don't lose a pending write when the page is hidden/closed or the component unmounts
+  useEffect(() => {
+    window.addEventListener('pagehide', flushHistory);
+    return () => {
+      window.removeEventListener('pagehide', flushHistory);
+      flushHistory();
     };
-  };
+  }, [flushHistory]);
 
   const handleGenerate = async () => {
+    // Enter bypasses the disabled button, so fold repeat requests into the one in flight
+    if (isGenerating) return;
+
     if (!prompt.trim()) {
       toast({
         title: "Error",
@@ -200,10 +413,14 @@ const CLIAssistant: React.FC = () => {
 
     setIsGenerating(true);
     try {
-      // Simulate API delay
-      await new Promise(resolve => setTimeout(resolve, 1000));
+      // Simulate API delay; prompts already in the pattern cache answer immediately
+      if (!patternCache.has(prompt.toLowerCase())) {
+        const waitStart = performance.now();
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        measurePhase('model-latency', waitStart);
+      }
       
-      const command = await generateCommand(prompt);
+      const command = timePhase('generate-command', () => generateCommand(prompt));
       setCurrentCommand(command);
       
       toast({
@@ -225,7 +442,7 @@ const CLIAssistant: React.FC = () => {
     if (!currentCommand) return;
 
     const executedCommand = { ...currentCommand, executed: true };
-    setHistory(prev => [executedCommand, ...prev]);
+    setHistory(prev => [executedCommand, ...prev.slice(0, MAX_HISTORY - 1)]);
     
     toast({
       title: "Command Executed",
@@ -238,7 +455,7 @@ const CLIAssistant: React.FC = () => {
   };
 
   const exportHistory = () => {
-    const dataStr = JSON.stringify(history, null, 2);
+    const dataStr = JSON.stringify(history);
     const dataBlob = new Blob([dataStr], { type: 'application/json' });
     const url = URL.createObjectURL(dataBlob);
     const link = document.createElement('a');
@@ -254,8 +471,14 @@ const CLIAssistant: React.FC = () => {
   };
 
   const exportScript = () => {
-    const executedCommands = history.filter(cmd => cmd.executed);
-    if (executedCommands.length === 0) {
+    // Walk history oldest-first so the script replays commands in the order they were run,
+    // and hand the pieces to Blob directly instead of concatenating one large string
+    const scriptParts = [`#!/bin/bash\n# Generated by CLI Assistant\n# Generated on: ${new Date().toISOString()}`];
+    for (let i = history.length - 1; i >= 0; i--) {
+      const cmd = history[i];
+      if (cmd.executed) scriptParts.push(`\n\n# ${toScriptComment(cmd.prompt)}\n${cmd.command}`);
+    }
+    if (scriptParts.length === 1) {
       toast({
         title: "No Commands",
         description: "No executed commands to export",
@@ -264,10 +487,7 @@ const CLIAssistant: React.FC = () => {
       return;
     }
 
-    const script = `#!/bin/bash\n# Generated by CLI Assistant\n# Generated on: ${new Date().toISOString()}\n\n` +
-      executedCommands.map(cmd => `# ${cmd.prompt}\n${cmd.command}`).join('\n\n');
-    
-    const blob = new Blob([script], { type: 'text/plain' });
+    const blob = new Blob(scriptParts, { type: 'text/plain' });
     const url = URL.createObjectURL(blob);
     const link = document.createElement('a');
     link.href = url;
@@ -283,38 +503,21 @@ const CLIAssistant: React.FC = () => {
 
   const clearHistory = () => {
     setHistory([]);
-    localStorage.removeItem('cli-assistant-history');
+    unsavedHistory.current = null;
+    localStorage.removeItem(HISTORY_STORAGE_KEY);
     toast({
       title: "History Cleared",
       description: "All command history has been cleared",
     });
   };
 
-  const copyCommand = (command: string) => {
+  const copyCommand = useCallback((command: string) => {
     navigator.clipboard.writeText(command);
     toast({
       title: "Copied",
       description: "Command copied to clipboard",
     });
-  };
-
-  const getRiskColor = (risk: string) => {
-    switch (risk) {
-      case 'low': return 'bg-green-100 text-green-800';
-      case 'medium': return 'bg-yellow-100 text-yellow-800';
-      case 'high': return 'bg-red-100 text-red-800';
-      default: return 'bg-gray-100 text-gray-800';
-    }
-  };
-
-  const getRiskIcon = (risk: string) => {
-    switch (risk) {
-      case 'low': return <CheckCircle className="w-4 h-4" />;
-      case 'medium': return <AlertTriangle className="w-4 h-4" />;
-      case 'high': return <XCircle className="w-4 h-4" />;
-      default: return <AlertTriangle className="w-4 h-4" />;
-    }
-  };
+  }, [toast]);
 
   return (
     <div className="max-w-4xl mx-auto p-6 space-y-6">
@@ -357,12 +560,7 @@ const CLIAssistant: React.FC = () => {
           {/* Example prompts */}
           <div className="flex flex-wrap gap-2">
             <span className="text-sm text-gray-500">Try:</span>
-            {[
-              'list all files',
-              'check disk usage',
-              'find Python files',
-              'show running processes'
-            ].map((example) => (
+            {examplePrompts.map((example) => (
               <Button
                 key={example}
                 variant="outline"
@@ -458,24 +656,14 @@ const CLIAssistant: React.FC = () => {
               <div className="space-y-2">
                 <h4 className="font-medium">Risk Distribution</h4>
                 <div className="space-y-1">
-                  <div className="flex justify-between items-center">
-                    <span className="text-sm">Low Risk</span>
-                    <Badge className="bg-green-100 text-green-800">
-                      {statistics.riskDistribution.low}
-                    </Badge>
-                  </div>
-                  <div className="flex justify-between items-center">
-                    <span className="text-sm">Medium Risk</span>
-                    <Badge className="bg-yellow-100 text-yellow-800">
-                      {statistics.riskDistribution.medium}
-                    </Badge>
-                  </div>
-                  <div className="flex justify-between items-center">
-                    <span className="text-sm">High Risk</span>
-                    <Badge className="bg-red-100 text-red-800">
-                      {statistics.riskDistribution.high}
-                    </Badge>
-                  </div>
+                  {riskDistributionRows.map(({ risk, label, className }) => (
+                    <div key={risk} className="flex justify-between items-center">
+                      <span className="text-sm">{label}</span>
+                      <Badge className={className}>
+                        {statistics.riskDistribution[risk]}
+                      </Badge>
+                    </div>
+                  ))}
                 </div>
               </div>
             </div>
@@ -485,7 +673,13 @@ const CLIAssistant: React.FC = () => {
         {/* Settings Dialog */}
         <Dialog>
           <DialogTrigger asChild>
-            <Button variant="outline" className="flex items-center gap-2">
+            {/* Start fetching the settings chunk on intent so the dialog opens without a blank frame */}
+            <Button
+              variant="outline"
+              className="flex items-center gap-2"
+              onMouseEnter={prefetchSettingsTabs}
+              onFocus={prefetchSettingsTabs}
+            >
               <Settings className="w-4 h-4" />
               Settings
             </Button>
@@ -497,86 +691,23 @@ const CLIAssistant: React.FC = () => {
                 Manage your CLI Assistant preferences
               </DialogDescription>
             </DialogHeader>
-            <Tabs defaultValue="export" className="w-full">
-              <TabsList className="grid w-full grid-cols-2">
-                <TabsTrigger value="export">Export/Import</TabsTrigger>
-                <TabsTrigger value="data">Data Management</TabsTrigger>
-              </TabsList>
-              
-              <TabsContent value="export" className="space-y-4">
-                <div className="space-y-2">
-                  <Button onClick={exportHistory} className="w-full flex items-center gap-2">
-                    <Download className="w-4 h-4" />
-                    Export History (JSON)
-                  </Button>
-                  <Button onClick={exportScript} className="w-full flex items-center gap-2">
-                    <Download className="w-4 h-4" />
-                    Export as Shell Script
-                  </Button>
-                </div>
-              </TabsContent>
-              
-              <TabsContent value="data" className="space-y-4">
-                <Button 
-                  onClick={clearHistory} 
-                  variant="destructive" 
-                  className="w-full flex items-center gap-2"
-                >
-                  <Trash2 className="w-4 h-4" />
-                  Clear All History
-                </Button>
-              </TabsContent>
-            </Tabs>
+            {/* Tabs are split into their own chunk and only fetched once the dialog opens */}
+            <SettingsTabsBoundary>
+              <Suspense fallback={null}>
+                <SettingsTabs
+                  onExportHistory={exportHistory}
+                  onExportScript={exportScript}
+                  onClearHistory={clearHistory}
+                />
+              </Suspense>
+            </SettingsTabsBoundary>
           </DialogContent>
         </Dialog>
       </div>
 
       {/* Command History */}
       {history.length > 0 && (
-        <Card>
-          <CardHeader>
-            <CardTitle className="flex items-center gap-2">
-              <History className="w-5 h-5" />
-              Command History ({history.length})
-            </CardTitle>
-          </CardHeader>
-          <CardContent>
-            <div className="space-y-3 max-h-96 overflow-y-auto">
-              {history.map((cmd) => (
-                <div key={cmd.id} className="border rounded-lg p-3 space-y-2">
-                  <div className="flex items-center justify-between">
-                    <span className="text-sm text-gray-600">{cmd.prompt}</span>
-                    <div className="flex items-center gap-2">
-                      <Badge className={getRiskColor(cmd.riskLevel)}>
-                        {cmd.riskLevel}
-                      </Badge>
-                      {cmd.executed && (
-                        <Badge className="bg-blue-100 text-blue-800">
-                          executed
-                        </Badge>
-                      )}
-                    </div>
-                  </div>
-                  <div className="flex items-center justify-between">
-                    <code className="text-sm bg-gray-100 px-2 py-1 rounded flex-1 mr-2">
-                      {cmd.command}
-                    </code>
-                    <Button
-                      variant="outline"
-                      size="sm"
-                      onClick={() => copyCommand(cmd.command)}
-                    >
-                      <Copy className="w-3 h-3" />
-                    </Button>
-                  </div>
-                  <div className="text-xs text-gray-500">
-                    {cmd.timestamp.toLocaleString()}
-                  </div>
-                </div>
-              ))}
-            </div>
-          </CardContent>
-        </Card>
+        <HistoryList history={history} onCopy={copyCommand} />
       )}
     </div>
   );
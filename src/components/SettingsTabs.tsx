@@ -0,0 +1,47 @@
+import React from 'react';
+import { Button } from './ui/button';
+import { Tabs, TabsContent, TabsList, TabsTrigger } from './ui/tabs';
+import { Download, Trash2 } from 'lucide-react';
+
+interface SettingsTabsProps {
+  onExportHistory: () => void;
+  onExportScript: () => void;
+  onClearHistory: () => void;
+}
+
+const SettingsTabs: React.FC<SettingsTabsProps> = ({ onExportHistory, onExportScript, onClearHistory }) => {
+  return (
+    <Tabs defaultValue="export" className="w-full">
+      <TabsList className="grid w-full grid-cols-2">
+        <TabsTrigger value="export">Export/Import</TabsTrigger>
+        <TabsTrigger value="data">Data Management</TabsTrigger>
+      </TabsList>
+      
+      <TabsContent value="export" className="space-y-4">
+        <div className="space-y-2">
+          <Button onClick={onExportHistory} className="w-full flex items-center gap-2">
+            <Download className="w-4 h-4" />
+            Export History (JSON)
+          </Button>
+          <Button onClick={onExportScript} className="w-full flex items-center gap-2">
+            <Download className="w-4 h-4" />
+            Export as Shell Script
+          </Button>
+        </div>
+      </TabsContent>
+      
+      <TabsContent value="data" className="space-y-4">
+        <Button 
+          onClick={onClearHistory} 
+          variant="destructive" 
+          className="w-full flex items-center gap-2"
+        >
+          <Trash2 className="w-4 h-4" />
+          Clear All History
+        </Button>
+      </TabsContent>
+    </Tabs>
+  );
+};
+
+export default SettingsTabs;